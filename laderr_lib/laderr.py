@@ -1,14 +1,43 @@
+import atexit
+import contextlib
+import hashlib
+import importlib.resources
+import importlib.util
 import os
+import pathlib
+import pickle
+import stat
 import tomllib
-from collections import defaultdict
+from datetime import datetime
 from urllib.parse import urlparse
 
-import toml
-from icecream import ic
+import rdflib
 from loguru import logger
 from pyshacl import validate
-from rdflib import Graph, Namespace, RDF, Literal, XSD, RDFS
+from rdflib import BNode, Graph, Namespace, RDF, Literal, XSD, RDFS, URIRef
 from rdflib.exceptions import ParserError
+from rdflib.term import Node
+
+# Prefer the native `rtoml` parser when installed, falling back to the standard library's pure-Python `tomllib`
+try:
+    import rtoml
+
+    _toml_loads = rtoml.loads
+    TOML_DECODE_ERRORS: tuple[type[Exception], ...] = (tomllib.TOMLDecodeError, rtoml.TomlParsingError)
+except ImportError:
+    _toml_loads = tomllib.loads
+    TOML_DECODE_ERRORS = (tomllib.TOMLDecodeError,)
+
+# Prefer the native `pyoxigraph` Turtle parser when installed, falling back to rdflib's pure-Python parser
+try:
+    import pyoxigraph
+
+    OXIGRAPH_AVAILABLE = True
+except ImportError:
+    OXIGRAPH_AVAILABLE = False
+
+# Jelly (binary RDF) serialization is provided by the optional `pyjelly` package, registered as an rdflib plugin
+JELLY_AVAILABLE = importlib.util.find_spec("pyjelly") is not None
 
 
 class Laderr:
@@ -22,6 +51,135 @@ class Laderr:
 
     LADER_NS = Namespace("https://w3id.org/pedropaulofb/laderr#")
 
+    # Locations of the LaDeRR schema file and of the directory with the SHACL shapes files, set through the
+    # `LADERR_SCHEMA_PATH` and `LADERR_SHAPES_PATH` variables. These are currently required, as the package does not
+    # ship these files yet; if not set, the files are looked up in the package and a `FileNotFoundError` is raised.
+    SCHEMA_PATH: str | None = os.environ.get("LADERR_SCHEMA_PATH")
+    SHAPES_PATH: str | None = os.environ.get("LADERR_SHAPES_PATH")
+
+    # Names under which the schema file and shapes directory are looked up in the package, and their file system
+    # locations. The locations are resolved on first use (extracting the files when the package is zipped) and kept
+    # until the interpreter exits.
+    _PACKAGED_SCHEMA = "laderr-schema-v0.2.0.ttl"
+    _PACKAGED_SHAPES = "shapes"
+    _PACKAGED_PATHS: dict[str, str] = {}
+    _PACKAGED_FILES = contextlib.ExitStack()
+    atexit.register(_PACKAGED_FILES.close)
+
+    # Directory where the parsed schema and shapes graphs are persisted across processes, set through the
+    # `LADERR_CACHE_DIR` variable. The on-disk cache is disabled when no directory is set.
+    CACHE_DIR: str | None = os.environ.get("LADERR_CACHE_DIR") or None
+
+    # Frequently used terms, resolved once at import time
+    _RDF_TYPE = RDF.type
+    _RDFS_LABEL = RDFS.label
+    _LADERR_SPECIFICATION = LADER_NS.LaderrSpecification
+    _COMPOSED_OF = LADER_NS.composedOf
+
+    # Expected datatypes of the metadata keys, and the datatype used for keys not listed
+    _EXPECTED_DATATYPES: dict[str, URIRef] = {"title": XSD.string, "description": XSD.string, "version": XSD.string,
+        "createdBy": XSD.string, "createdOn": XSD.dateTime, "modifiedOn": XSD.dateTime, "baseUri": XSD.anyURI, }
+    _DEFAULT_DATATYPE = XSD.anyURI
+
+    # URIRefs of the fixed laderr vocabulary used by every specification, built at import time. Other terms (e.g., the
+    # classes of the data sections) are named by the specification, so they are only reused within a single call.
+    _LADERR_VOCABULARY = ("LaderrSpecification", "composedOf", *_EXPECTED_DATATYPES)
+    _LADERR_TERMS: dict[str, URIRef] = dict(zip(_LADERR_VOCABULARY, map(LADER_NS.term, _LADERR_VOCABULARY)))
+
+    # Base URI used when the specification does not provide a valid one
+    _DEFAULT_BASE_URI = "https://laderr.laderr#"
+
+    # Static graphs parsed lazily on first use and reused by all subsequent validations. Merged SHACL shapes graphs
+    # are cached per directory together with the (name, modification time, size) signature of the directory's files.
+    _SHACL_GRAPH_CACHE: dict[str, tuple[tuple[tuple[str, int, int], ...], Graph]] = {}
+    _SCHEMA_GRAPH: Graph | None = None
+
+    # Extensions of the files read from the SHACL shapes directory
+    _SHACL_FILE_EXTENSIONS = (".ttl", ".shacl")
+
+    @staticmethod
+    def _new_graph() -> Graph:
+        """
+        Creates an empty RDFLib graph for specification data, binding only rdflib's core prefixes.
+
+        By default, rdflib binds all its ~30 known namespaces when a graph's namespace manager is first used, which
+        dominates the cost of creating small graphs. Only the core prefixes (owl, rdf, rdfs, xsd, and xml) are needed.
+
+        :return: An empty RDFLib graph.
+        :rtype: Graph
+        """
+        return Graph(bind_namespaces="core")
+
+    @classmethod
+    def _laderr_term(cls, name: str, cache: dict[str, URIRef] | None = None) -> URIRef:
+        """
+        Returns the URIRef of a class or property in the laderr namespace, reusing previously built references.
+
+        Terms of the fixed laderr vocabulary are taken from `_LADERR_TERMS`. Other terms are reused through the given
+        cache, which callers keep for a single call only, so that names read from specifications are not retained.
+
+        :param name: Local name of the term (e.g., "RiskEvent" or "description").
+        :type name: str
+        :param cache: Terms outside the fixed vocabulary already built by the caller. Not used if not provided.
+        :type cache: dict[str, URIRef] | None
+        :return: The URIRef of the term in the laderr namespace.
+        :rtype: URIRef
+        """
+        term = cls._LADERR_TERMS.get(name)
+        if term is None:
+            if cache is None:
+                return cls.LADER_NS[name]
+            term = cache.get(name)
+            if term is None:
+                term = cache[name] = cls.LADER_NS[name]
+        return term
+
+    @classmethod
+    def _metadata_literal(cls, value: object, datatype: URIRef) -> Literal:
+        """
+        Creates the literal of a metadata value with the given datatype.
+
+        TOML date-times are already parsed into `datetime` objects, which rdflib maps to `xsd:dateTime` by itself. For
+        these values the datatype is not passed, skipping rdflib's datatype resolution while producing the same literal.
+
+        :param value: Metadata value as read from the specification.
+        :type value: object
+        :param datatype: Expected datatype of the value.
+        :type datatype: URIRef
+        :return: The literal representing the value.
+        :rtype: Literal
+        """
+        if isinstance(value, datetime) and datatype == XSD.dateTime:
+            return Literal(value)
+        return Literal(value, datatype=datatype)
+
+    @staticmethod
+    def _cached_literal(value: object, cache: dict[tuple[type, object], Literal]) -> Literal:
+        """
+        Returns the literal representing the given value, reusing the literal already built for an equal value.
+
+        Only `str`, `int`, and `bool` values are cached, as their equal values always have the same lexical form. The
+        cache is keyed by the value's type as well, so that `1` and `True` are not mapped to the same literal. Values of
+        other types are always built anew, because equal values may have different lexical forms (e.g., `0.0` and
+        `-0.0`, or equal date-times in different time zones).
+
+        :param value: Value to be represented as a literal.
+        :type value: object
+        :param cache: Literals already built, keyed by value type and value.
+        :type cache: dict[tuple[type, object], Literal]
+        :return: The literal representing the value.
+        :rtype: Literal
+        """
+        value_type = type(value)
+        if value_type is not str and value_type is not int and value_type is not bool:
+            return Literal(value)
+
+        key = (value_type, value)
+        literal = cache.get(key)
+        if literal is None:
+            literal = cache[key] = Literal(value)
+        return literal
+
     @classmethod
     def _validate_base_uri(cls, spec_metadata_dict: dict[str, object]) -> str:
         """
@@ -33,51 +191,78 @@ class Laderr:
         :return: A valid base URI.
         :rtype: str
         """
-        base_uri = spec_metadata_dict.get("baseUri", "https://laderr.laderr#")
+        base_uri = spec_metadata_dict.get("baseUri", cls._DEFAULT_BASE_URI)
+        if not isinstance(base_uri, str):
+            logger.warning(f"Invalid base URI '{base_uri}' provided. Using default '{cls._DEFAULT_BASE_URI}'.")
+            return cls._DEFAULT_BASE_URI
+
+        if base_uri == cls._DEFAULT_BASE_URI:
+            return base_uri
+
         # Check if base_uri is a valid URI
         parsed = urlparse(base_uri)
         if not all([parsed.scheme, parsed.netloc]):
-            ic("here")
-            logger.warning(f"Invalid base URI '{base_uri}' provided. Using default 'https://laderr.laderr#'.")
+            logger.warning(f"Invalid base URI '{base_uri}' provided. Using default '{cls._DEFAULT_BASE_URI}'.")
+            return cls._DEFAULT_BASE_URI
 
         return base_uri
 
     @classmethod
-    def _load_spec_data(cls, spec_metadata: dict[str, object], spec_data: dict[str, object]) -> Graph:
+    def _load_spec_data(cls, spec_metadata: dict[str, object], spec_data: dict[str, object],
+                        graph: Graph | None = None, base_uri: str | None = None) -> Graph:
         """
         Loads the data section from the specification into an RDFLib graph and adds the `composedOf` relationship.
 
         If the `id` property is not explicitly defined within a section, the id is automatically set to the section's
         key name (e.g., "X" from [RiskEvent.X]).
 
-        The base URI from `spec_metadata` is used as the namespace for the data.
+        The base URI from `spec_metadata` is used as the namespace for the data. The `rdf:type` triple of the
+        specification itself is added by `_load_spec_metadata`, which is always loaded into the same graph.
 
         :param spec_metadata: Metadata dictionary containing the base URI.
         :type spec_metadata: dict[str, object]
         :param spec_data: Dictionary representing the `data` section of the specification.
         :type spec_data: dict[str, object]
+        :param graph: Graph into which the triples are added. A new graph is created if not provided.
+        :type graph: Graph | None
+        :param base_uri: Base URI already validated by the caller. If not provided, it is obtained from `spec_metadata`.
+        :type base_uri: str | None
         :return: RDFLib graph containing the data and `composedOf` relationship.
         :rtype: Graph
         """
-        # Initialize an empty graph
-        graph = Graph()
+        # Initialize an empty graph if no target graph is provided
+        if graph is None:
+            graph = cls._new_graph()
 
-        # Get the base URI from spec_metadata_dict and bind namespaces
-        base_uri = cls._validate_base_uri(spec_metadata)
+        # Get the base URI from spec_metadata_dict (unless provided) and bind namespaces
+        if base_uri is None:
+            base_uri = cls._validate_base_uri(spec_metadata)
         data_ns = Namespace(base_uri)
         laderr_ns = cls.LADER_NS
         graph.bind("", data_ns)  # Bind the `:` namespace
         graph.bind("laderr", laderr_ns)  # Bind the `laderr:` namespace
 
-        # Create or identify the single RiskSpecification instance
+        # Collect all triples as quads and insert them into the graph in a single bulk operation
+        quads: list[tuple[Node, Node, Node, Graph]] = []
+
+        # Literals and laderr terms built so far, reused when instances share the same values and properties
+        literals: dict[tuple[type, object], Literal] = {}
+        terms: dict[str, URIRef] = {}
+        rdf_type = cls._RDF_TYPE
+        rdfs_label = cls._RDFS_LABEL
+        composed_of = cls._COMPOSED_OF
+
+        # Identify the single LaderrSpecification instance, typed by `_load_spec_metadata`
         specification_uri = data_ns.LaderrSpecification
-        graph.add((specification_uri, RDF.type, laderr_ns.LaderrSpecification))
 
         # Iterate over the sections in the data
         for class_type, instances in spec_data.items():
             if not isinstance(instances, dict):
                 raise ValueError(f"Invalid structure for {class_type}. Expected a dictionary of instances.")
 
+            # All instances of a section share the same class
+            class_uri = cls._laderr_term(class_type, terms)
+
             for key, properties in instances.items():
                 if not isinstance(properties, dict):
                     raise ValueError(
@@ -88,7 +273,7 @@ class Laderr:
 
                 # Create the RDF node for the instance
                 instance_uri = data_ns[instance_id]
-                graph.add((instance_uri, RDF.type, laderr_ns[class_type]))
+                quads.append((instance_uri, rdf_type, class_uri, graph))
 
                 # Add properties to the instance
                 for prop, value in properties.items():
@@ -97,163 +282,470 @@ class Laderr:
 
                     if prop == "label":
                         # Map 'label' to 'rdfs:label'
-                        graph.add((instance_uri, RDFS.label, Literal(value)))
+                        quads.append((instance_uri, rdfs_label, cls._cached_literal(value, literals), graph))
                     else:
                         # Map other properties to laderr namespace
+                        property_uri = cls._laderr_term(prop, terms)
                         if isinstance(value, list):
-                            for item in value:
-                                graph.add((instance_uri, laderr_ns[prop], Literal(item)))
+                            quads.extend((instance_uri, property_uri, cls._cached_literal(item, literals), graph)
+                                         for item in value)
                         else:
-                            graph.add((instance_uri, laderr_ns[prop], Literal(value)))
+                            quads.append((instance_uri, property_uri, cls._cached_literal(value, literals), graph))
 
                 # Add the composedOf relationship
-                graph.add((specification_uri, laderr_ns.composedOf, instance_uri))
+                quads.append((specification_uri, composed_of, instance_uri, graph))
 
+        graph.addN(quads)
         return graph
 
     @classmethod
-    def _load_spec_metadata(cls, metadata: dict[str, object]) -> Graph:
+    def _load_spec_metadata(cls, metadata: dict[str, object], graph: Graph | None = None,
+                            base_uri: str | None = None) -> Graph:
         """
         Creates an RDF graph containing only the provided spec_metadata_dict.
 
+        If no `baseUri` is declared, the default base URI used as namespace for the data is added to the metadata. A
+        declared `baseUri` is always kept as declared, even when it is invalid and the data therefore uses the default
+        base URI: replacing it would hide the invalid value (e.g., a list of URIs violating the property's
+        multiplicity) from the SHACL validation.
+
         :param metadata: Metadata dictionary to add to the graph.
         :type metadata: dict[str, object]
-        :return: A new RDFLib graph containing only the spec_metadata_dict.
+        :param graph: Graph into which the triples are added. A new graph is created if not provided.
+        :type graph: Graph | None
+        :param base_uri: Base URI already validated by the caller. If not provided, it is obtained from `metadata`.
+        :type base_uri: str | None
+        :return: The RDFLib graph containing the spec_metadata_dict.
         :rtype: Graph
         """
-        # Define expected datatypes for spec_metadata_dict keys
-        expected_datatypes = {"title": XSD.string, "description": XSD.string, "version": XSD.string,
-            "createdBy": XSD.string, "createdOn": XSD.dateTime, "modifiedOn": XSD.dateTime, "baseUri": XSD.anyURI, }
-
-        # Validate base URI and bind namespaces
-        base_uri = cls._validate_base_uri(metadata)
+        # Validate base URI (unless provided) and bind namespaces
+        if base_uri is None:
+            base_uri = cls._validate_base_uri(metadata)
         data_ns = Namespace(base_uri)
         laderr_ns = cls.LADER_NS
 
-        # Create a new graph
-        graph = Graph()
+        # Create a new graph if no target graph is provided
+        if graph is None:
+            graph = cls._new_graph()
         graph.bind("", data_ns)  # Bind the `:` namespace
         graph.bind("laderr", laderr_ns)  # Bind the `laderr:` namespace
 
+        # Collect all triples as quads and insert them into the graph in a single bulk operation
+        quads: list[tuple[Node, Node, Node, Graph]] = []
+
         # Create or identify LaderrSpecification instance
         specification = data_ns.LaderrSpecification
-        graph.add((specification, RDF.type, laderr_ns.LaderrSpecification))
+        quads.append((specification, cls._RDF_TYPE, cls._LADERR_SPECIFICATION, graph))
 
         # Add spec_metadata_dict as properties of the specification
         for key, value in metadata.items():
-            property_uri = laderr_ns[key]  # Schema properties come from laderr namespace
-            datatype = expected_datatypes.get(key, XSD.anyURI)  # Default to xsd:string if not specified
+            # Schema properties come from laderr namespace
+            property_uri = cls._laderr_term(key)
+            datatype = cls._EXPECTED_DATATYPES.get(key, cls._DEFAULT_DATATYPE)
 
             # Handle lists
             if isinstance(value, list):
-                for item in value:
-                    graph.add((specification, property_uri, Literal(item, datatype=datatype)))
+                quads.extend((specification, property_uri, cls._metadata_literal(item, datatype), graph)
+                             for item in value)
             else:
                 # Add single value with specified datatype
-                graph.add((specification, property_uri, Literal(value, datatype=datatype)))
+                quads.append((specification, property_uri, cls._metadata_literal(value, datatype), graph))
+
+        # Make the base URI in use explicit when the specification does not declare it. Declared values, even invalid
+        # ones, are kept as they are so that the SHACL shapes validate them.
+        if "baseUri" not in metadata:
+            quads.append((specification, cls._laderr_term("baseUri"), Literal(base_uri, datatype=XSD.anyURI), graph))
 
+        graph.addN(quads)
         return graph
 
     @classmethod
-    def _validate_with_shacl(cls, data_graph: Graph) -> tuple[bool, str, Graph]:
+    def _validate_with_shacl(cls, data_graph: Graph, ontology_graph: Graph | None = None,
+                             inference: str = "both") -> tuple[bool, Graph, str]:
         """
         Validates an RDF graph against a SHACL shapes file.
 
-        :param data_graph: RDF graph to validate.
+        The shapes graph is obtained from `_load_shacl_shapes`, so it is parsed only once per process. The data graph is
+        validated in place (i.e., without being cloned by pySHACL), so the ontology and the inferred triples are added
+        to it. The ontology is still copied triple by triple into the data graph on every validation, which is the
+        main remaining cost of combining the specification with the LaDeRR schema.
+
+        :param data_graph: RDF graph to validate. It is expanded in place with the ontology and inferred triples.
         :type data_graph: Graph
+        :param ontology_graph: Ontology mixed into the data graph before validation (e.g., the LaDeRR schema).
+        :type ontology_graph: Graph | None
+        :param inference: Inference applied to the data graph before validation: "rdfs", "owlrl", "both", or "none".
+                          Default is "both".
+        :type inference: str
         :return: A tuple containing:
             - A boolean indicating if the graph is valid.
-            - A string with validation results.
             - A graph with validation report.
-        :rtype: Tuple[bool, str, Graph]
+            - A string with validation results.
+        :rtype: tuple[bool, Graph, str]
         """
-        shacl_files_path = "C:\\Users\\FavatoBarcelosPP\\Dev\\laderr\\shapes"
-        shacl_graph = Laderr._merge_shacl_files(shacl_files_path)
-        ic(len(shacl_graph))
+        shacl_graph = cls._load_shacl_shapes()
 
-        conforms, report_graph, report_text = validate(data_graph=data_graph, shacl_graph=shacl_graph, inference="both",
-                                                       allow_infos=True, allow_warnings=True)
+        conforms, report_graph, report_text = validate(data_graph=data_graph, shacl_graph=shacl_graph,
+                                                       ont_graph=ontology_graph, inference=inference, inplace=True,
+                                                       advanced=False, meta_shacl=False, js=False, allow_infos=True,
+                                                       allow_warnings=True)
 
         return conforms, report_graph, report_text
 
     @classmethod
-    def _merge_shacl_files(cls, shacl_files_path: str) -> Graph:
+    def _data_path(cls, configured_path: str | None, resource: str, variable: str) -> str:
+        """
+        Returns the file system location of the LaDeRR schema file or shapes directory.
+
+        The configured location is used when set. Otherwise, the resource shipped in the package is located with
+        `importlib.resources`, which provides a temporary copy of it when the package is installed zipped.
+
+        :param configured_path: The location set by the user, or None to use the resource shipped in the package.
+        :type configured_path: str | None
+        :param resource: The name of the resource in the package (e.g., "shapes").
+        :type resource: str
+        :param variable: The environment variable through which the location can be set.
+        :type variable: str
+        :return: The file system location of the schema file or shapes directory.
+        :rtype: str
+        :raises FileNotFoundError: If no location is set and the resource is not shipped in the package.
         """
-        Merges all SHACL files in the given path into a single RDFLib graph.
+        if configured_path is not None:
+            return configured_path
+
+        path = cls._PACKAGED_PATHS.get(resource)
+        if path is None:
+            packaged = importlib.resources.files("laderr_lib") / resource
+            if not (packaged.is_file() or packaged.is_dir()):
+                raise FileNotFoundError(f"The LaDeRR resource '{resource}' is not shipped with laderr-lib. "
+                                        f"Set the `{variable}` environment variable to its location.")
+            path = str(cls._PACKAGED_FILES.enter_context(importlib.resources.as_file(packaged)))
+            cls._PACKAGED_PATHS[resource] = path
+        return path
+
+    @classmethod
+    def _load_shacl_shapes(cls) -> Graph:
+        """
+        Returns the graph with all LaDeRR SHACL shapes, read from the directory in `SHAPES_PATH` or, if not set, from
+        a shapes directory in the package (currently not shipped).
+
+        The shapes are parsed only on the first call or after the shapes files change (see `_merge_shacl_files`).
+        Callers must not modify the returned graph. pySHACL itself, however, adds two axioms to it on the first
+        validation (`owl:Class rdfs:subClassOf rdfs:Class` and `owl:DatatypeProperty rdfs:subClassOf rdf:Property`).
+        Adding them again changes nothing, so later validations see the same graph, but the in-memory graph then holds
+        these two triples more than the graph persisted in `CACHE_DIR`.
 
-        :param shacl_files_path: The directory path containing SHACL files.
-        :type shacl_files_path: str
         :return: A single RDFLib graph containing all merged SHACL shapes.
         :rtype: Graph
-        :raises FileNotFoundError: If the directory or files are not found.
-        :raises ValueError: If the directory does not contain valid SHACL files.
+        :raises FileNotFoundError: If no shapes directory is set and none is shipped in the package.
+        """
+        return cls._merge_shacl_files(cls._data_path(cls.SHAPES_PATH, cls._PACKAGED_SHAPES, "LADERR_SHAPES_PATH"))
+
+    @staticmethod
+    def _graph_cache_key(sources: list[tuple[str, bytes]]) -> str:
+        """
+        Computes the key under which the graph parsed from the given sources is persisted in `CACHE_DIR`.
+
+        The key is a SHA-256 digest of the installed RDFLib version and of each source's base IRI and content, so any
+        change to the parsed files or to the library producing the pickled graph results in a new key.
+
+        :param sources: The base IRI and content of each parsed file, in parsing order.
+        :type sources: list[tuple[str, bytes]]
+        :return: The hexadecimal cache key.
+        :rtype: str
+        """
+        digest = hashlib.sha256(rdflib.__version__.encode("utf-8"))
+        for base_iri, content in sources:
+            for part in (base_iri.encode("utf-8"), content):
+                digest.update(len(part).to_bytes(8, "little"))
+                digest.update(part)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _graph_cache_name(kind: str, location: str) -> str:
+        """
+        Returns the name under which the graph parsed from the given location is persisted in `CACHE_DIR`.
+
+        The name combines the kind of graph with a digest of the location's absolute path, so the graphs parsed from
+        different schema files or shapes directories sharing the same `CACHE_DIR` are kept apart.
+
+        :param kind: The kind of persisted graph (e.g., "schema" or "shapes").
+        :type kind: str
+        :param location: The schema file or shapes directory from which the graph is parsed.
+        :type location: str
+        :return: The name of the persisted graph (e.g., "shapes-<path digest>").
+        :rtype: str
+        """
+        path_digest = hashlib.sha256(os.path.abspath(location).encode("utf-8")).hexdigest()[:16]
+        return f"{kind}-{path_digest}"
+
+    @classmethod
+    def _graph_cache_dir(cls) -> str | None:
+        """
+        Returns the directory of the on-disk graph cache in `CACHE_DIR`, creating it if needed.
+
+        Persisted graphs are loaded with `pickle`, which runs code stored in the loaded file. On POSIX systems, the
+        cache is therefore only used if its directory belongs to the current user and is not writable by other users.
+
+        :return: The cache directory, or None if the on-disk cache is disabled or its directory cannot be safely used.
+        :rtype: str | None
+        """
+        cache_dir = cls.CACHE_DIR
+        if not cache_dir:
+            return None
+
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            status = os.stat(cache_dir)
+        except OSError as e:
+            logger.warning(f"Ignoring unusable graph cache directory '{cache_dir}': {e}")
+            return None
+
+        if os.name == "posix" and (status.st_uid != os.getuid() or status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+            logger.warning(f"Ignoring graph cache directory '{cache_dir}', which other users can write to.")
+            return None
+
+        return cache_dir
+
+    @classmethod
+    def _load_cached_graph(cls, name: str, cache_key: str) -> Graph | None:
+        """
+        Loads the graph persisted in `CACHE_DIR` under the given name and key.
+
+        :param name: The name of the persisted graph, as returned by `_graph_cache_name`.
+        :type name: str
+        :param cache_key: The key computed by `_graph_cache_key`.
+        :type cache_key: str
+        :return: The persisted graph, or None if the on-disk cache is disabled or holds no usable graph for the key.
+        :rtype: Graph | None
         """
-        # Initialize an empty RDFLib graph
-        merged_graph = Graph()
+        cache_dir = cls._graph_cache_dir()
+        if cache_dir is None:
+            return None
 
-        # Ensure the provided path is valid
-        if not os.path.isdir(shacl_files_path):
-            raise FileNotFoundError(f"The path '{shacl_files_path}' does not exist or is not a directory.")
+        cache_file = os.path.join(cache_dir, f"{name}-{cache_key}.pkl")
+        try:
+            with open(cache_file, "rb") as file:
+                graph = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable graph cache file '{cache_file}': {e}")
+            return None
 
-        # Iterate over all files in the directory
-        for filename in os.listdir(shacl_files_path):
-            ic(filename)
-            file_path = os.path.join(shacl_files_path, filename)
+        return graph if isinstance(graph, Graph) else None
 
-            # Skip non-files
-            if not os.path.isfile(file_path):
-                continue
+    @classmethod
+    def _store_cached_graph(cls, name: str, cache_key: str, graph: Graph) -> None:
+        """
+        Persists the given graph in `CACHE_DIR` under the given name and key. Failures are logged and otherwise ignored.
+
+        The graph is written to a temporary file that then replaces the cache file, so concurrent processes never read a
+        partially written graph. Graphs previously persisted under the same name (i.e., for older contents of the
+        files parsed from the same location) are removed; graphs parsed from other locations are kept.
 
-            # Attempt to parse the SHACL file
+        :param name: The name of the persisted graph, as returned by `_graph_cache_name`.
+        :type name: str
+        :param cache_key: The key computed by `_graph_cache_key`.
+        :type cache_key: str
+        :param graph: The graph to be persisted.
+        :type graph: Graph
+        """
+        cache_dir = cls._graph_cache_dir()
+        if cache_dir is None:
+            return
+
+        cache_file_name = f"{name}-{cache_key}.pkl"
+        cache_file = os.path.join(cache_dir, cache_file_name)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file, "wb") as file:
+                pickle.dump(graph, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+
+            # Remove the graphs persisted for older contents of the files at the same location
+            with os.scandir(cache_dir) as entries:
+                stale_files = [entry.path for entry in entries if entry.name.startswith(f"{name}-")
+                               and entry.name.endswith(".pkl") and entry.name != cache_file_name]
+            for stale_file in stale_files:
+                os.remove(stale_file)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Failed to write graph cache file '{cache_file}': {e}")
+        finally:
+            # The temporary file only remains if writing it failed
             try:
-                merged_graph.parse(file_path, format="turtle")
-            except Exception as e:
-                logger.warning(f"Failed to parse SHACL file '{filename}': {e}")
+                os.remove(temp_file)
+            except FileNotFoundError:
+                pass
 
-        if len(merged_graph) == 0:
-            raise ValueError(f"No valid SHACL files found in the directory '{shacl_files_path}'.")
+    @staticmethod
+    def _to_rdflib_term(term: "pyoxigraph.NamedNode | pyoxigraph.BlankNode | pyoxigraph.Literal") -> Node:
+        """
+        Converts a `pyoxigraph` term into the equivalent RDFLib term.
 
-        return merged_graph
+        Plain literals are typed as `xsd:string` by `pyoxigraph`; they are converted back into RDFLib literals without
+        datatype, as produced by RDFLib's own Turtle parser.
+
+        :param term: The `pyoxigraph` named node, blank node, or literal to be converted.
+        :type term: pyoxigraph.NamedNode | pyoxigraph.BlankNode | pyoxigraph.Literal
+        :return: The corresponding RDFLib term.
+        :rtype: URIRef | BNode | Literal
+        """
+        if isinstance(term, pyoxigraph.NamedNode):
+            return URIRef(term.value)
+        if isinstance(term, pyoxigraph.BlankNode):
+            return BNode(term.value)
+        if term.language is not None:
+            return Literal(term.value, lang=term.language)
+        if term.datatype.value == str(XSD.string):
+            return Literal(term.value)
+        return Literal(term.value, datatype=URIRef(term.datatype.value))
 
     @classmethod
-    def validate(cls, laderr_file_path: str):
-        # Syntactical validation
-        spec_metadata_dict, spec_data_dict = Laderr._read_specification(laderr_file_path)
+    def _parse_turtle(cls, graph: Graph, source: bytes, base_iri: str) -> None:
+        """
+        Parses Turtle content into the given RDFLib graph.
 
-        # Semantic validation
-        spec_metadata_graph = Laderr._load_spec_metadata(spec_metadata_dict)
-        spec_data_graph = Laderr._load_spec_data(spec_metadata_dict, spec_data_dict)
+        The native `pyoxigraph` parser is used when installed, with the parsed triples converted into RDFLib terms and
+        added in a single batch and the declared prefixes bound to the graph. Otherwise, RDFLib's Turtle parser is used.
+        Both parsers give each parsed blank node a fresh identifier, so equal labels in different files (e.g., `_:b0`)
+        never merge into the same node.
 
-        # Combine graphs
-        unified_graph = Graph()
-        unified_graph += spec_metadata_graph
-        unified_graph += spec_data_graph
+        :param graph: The RDFLib graph to which the parsed triples are added.
+        :type graph: Graph
+        :param source: The Turtle content to be parsed.
+        :type source: bytes
+        :param base_iri: The base IRI against which relative IRIs are resolved.
+        :type base_iri: str
+        """
+        if not OXIGRAPH_AVAILABLE:
+            graph.parse(data=source, format="turtle", publicID=base_iri)
+            return
 
-        Laderr._write_specification(spec_metadata_graph, spec_data_graph, "./testando.toml")
+        parser = pyoxigraph.parse(source, format=pyoxigraph.RdfFormat.TURTLE, base_iri=base_iri,
+                                  rename_blank_nodes=True)
 
-        # Combine instances with Schema for correct SHACL evaluation
-        laderr_schema = Laderr._load_schema()
-        validation_graph = Graph()
-        validation_graph += unified_graph
-        validation_graph += laderr_schema
+        to_term = cls._to_rdflib_term
+        graph.addN((to_term(quad.subject), to_term(quad.predicate), to_term(quad.object), graph) for quad in parser)
+
+        for prefix, namespace in parser.prefixes.items():
+            graph.bind(prefix, namespace)
+
+    @classmethod
+    def _merge_shacl_files(cls, shacl_files_path: str) -> Graph:
+        """
+        Merges all SHACL files (i.e., Turtle files with `.ttl` or `.shacl` extensions) in the given path into a single
+        RDFLib graph. Other files in the directory are ignored.
+
+        The merged graph is cached in `_SHACL_GRAPH_CACHE` and reused while no file in the directory is added, removed,
+        or modified. If the on-disk cache is enabled, it is also persisted in `CACHE_DIR`, keyed by the files' contents,
+        so that a new process loads it without parsing the files again.
+
+        :param shacl_files_path: The directory path containing SHACL files.
+        :type shacl_files_path: str
+        :return: A single RDFLib graph containing all merged SHACL shapes.
+        :rtype: Graph
+        :raises FileNotFoundError: If the directory or files are not found.
+        :raises ValueError: If the directory does not contain valid SHACL files.
+        """
+        # List the directory's SHACL files in a single pass, reusing the stat information gathered by the scan.
+        # An invalid path is reported by the scan itself, avoiding a separate existence check on every call.
+        try:
+            with os.scandir(shacl_files_path) as entries:
+                shacl_files = [entry for entry in entries
+                               if entry.name.endswith(cls._SHACL_FILE_EXTENSIONS) and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"The path '{shacl_files_path}' does not exist or is not a directory.") from e
+
+        # Reuse the cached graph if no file was added, removed, or modified since it was built
+        signature = tuple(sorted((entry.name, entry.stat().st_mtime_ns, entry.stat().st_size) for entry in shacl_files))
+        cached = cls._SHACL_GRAPH_CACHE.get(shacl_files_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # Read the SHACL files in a stable order, keyed by the base IRI used to parse them
+        sources = []
+        for entry in sorted(shacl_files, key=lambda shacl_file: shacl_file.name):
+            try:
+                with open(entry.path, "rb") as file:
+                    sources.append((pathlib.Path(entry.path).absolute().as_uri(), file.read()))
+            except OSError as e:
+                logger.warning(f"Failed to read SHACL file '{entry.name}': {e}")
+
+        # Reuse the graph persisted by a previous process for the same files, if any
+        cache_name = cls._graph_cache_name("shapes", shacl_files_path)
+        cache_key = cls._graph_cache_key(sources)
+        merged_graph = cls._load_cached_graph(cache_name, cache_key)
+
+        if merged_graph is None:
+            # Initialize an empty RDFLib graph
+            merged_graph = Graph()
+
+            # Iterate over all files in the directory
+            for base_iri, content in sources:
+                # Attempt to parse the SHACL file
+                try:
+                    cls._parse_turtle(merged_graph, content, base_iri)
+                except Exception as e:
+                    logger.warning(f"Failed to parse SHACL file '{base_iri}': {e}")
+
+            if len(merged_graph) == 0:
+                raise ValueError(f"No valid SHACL files found in the directory '{shacl_files_path}'.")
+
+            cls._store_cached_graph(cache_name, cache_key, merged_graph)
+
+        cls._SHACL_GRAPH_CACHE[shacl_files_path] = (signature, merged_graph)
+        return merged_graph
 
-        # Bind namespaces in the unified graph
+    @classmethod
+    def validate(cls, laderr_file_path: str, inference: str = "both", verbose: bool = True) -> bool:
+        """
+        Validates a LaDeRR specification, first syntactically (TOML) and then semantically (SHACL).
+
+        :param laderr_file_path: The path to the LaDeRR specification (TOML) file to be validated.
+        :type laderr_file_path: str
+        :param inference: Inference applied to the specification and the LaDeRR schema before the SHACL validation:
+                          "rdfs", "owlrl", "both", or "none". Default is "both". Lighter options are considerably faster
+                          but produce correct results only if the SHACL shapes do not rely on the omitted entailments.
+        :type inference: str
+        :param verbose: If True (default), the validation report is logged and the specification graph is written to
+                        './testando.toml' and './result.nt'. If False, only the validation result is returned.
+        :type verbose: bool
+        :return: True if the specification conforms to the LaDeRR SHACL shapes, False otherwise.
+        :rtype: bool
+        """
+        # Syntactical validation
+        spec_metadata_dict, spec_data_dict = Laderr._read_specification(laderr_file_path)
+
+        # Semantic validation: metadata and data are loaded directly into a single graph
         base_uri = cls._validate_base_uri(spec_metadata_dict)
-        unified_graph.bind("", Namespace(base_uri))  # Bind `:` to the base URI
-        unified_graph.bind("laderr", cls.LADER_NS)  # Bind `laderr:` to the schema namespace
+        unified_graph = Laderr._new_graph()
+        Laderr._load_spec_metadata(spec_metadata_dict, graph=unified_graph, base_uri=base_uri)
+        Laderr._load_spec_data(spec_metadata_dict, spec_data_dict, graph=unified_graph, base_uri=base_uri)
 
-        ic(len(spec_metadata_graph), len(spec_data_graph), len(unified_graph), len(laderr_schema),
-           len(validation_graph))
+        if verbose:
+            Laderr._write_specification(unified_graph, "./testando.toml")
+            # Saved before validation, which expands the unified graph in place with the schema and inferred triples
+            Laderr._save_graph(unified_graph, "./result.nt", format="nt")
 
-        conforms, _, report_text = Laderr._validate_with_shacl(validation_graph)
-        Laderr._report_validation_result(conforms, report_text)
-        Laderr._save_graph(unified_graph, "./result.ttl")
+        # Combine instances with Schema for correct SHACL evaluation
+        laderr_schema = Laderr._load_schema()
+        conforms, _, report_text = Laderr._validate_with_shacl(unified_graph, ontology_graph=laderr_schema,
+                                                               inference=inference)
+        if verbose:
+            Laderr._report_validation_result(conforms, report_text)
         return conforms
 
     @classmethod
     def _load_schema(cls) -> Graph:
         """
-        Safely reads an RDF file into an RDFLib graph.
+        Safely reads the LaDeRR schema file in `SCHEMA_PATH` or, if not set, a schema file in the package (currently
+        not shipped) into an RDFLib graph.
+
+        The file is read into memory in a single call and parsed from the buffer. The schema is parsed only once per
+        process; subsequent calls return the graph cached in `_SCHEMA_GRAPH`. If the on-disk cache is enabled, the
+        parsed graph is also persisted in `CACHE_DIR`, keyed by the file's content, and loaded from there by new
+        processes. Callers must treat the returned graph as read-only.
 
         :return: An RDFLib graph containing the data from the file.
         :rtype: Graph
@@ -261,17 +753,35 @@ class Laderr:
         :raises ValueError: If the file is not a valid RDF file or cannot be parsed.
         """
 
-        rdf_file_path = "C:\\Users\\FavatoBarcelosPP\\Dev\\laderr\\laderr-schema-v0.2.0.ttl"
+        if cls._SCHEMA_GRAPH is not None:
+            return cls._SCHEMA_GRAPH
 
-        # Initialize the graph
-        graph = Graph()
+        rdf_file_path = cls._data_path(cls.SCHEMA_PATH, cls._PACKAGED_SCHEMA, "LADERR_SCHEMA_PATH")
 
-        try:
-            # Parse the file into the graph
-            graph.parse(rdf_file_path)
-        except (ParserError, ValueError) as e:
-            raise ValueError(f"Failed to parse the RDF file '{rdf_file_path}'. Ensure it is a valid RDF file.") from e
+        with open(rdf_file_path, "rb") as file:
+            buffer = file.read()
+
+        base_iri = pathlib.Path(rdf_file_path).absolute().as_uri()
+
+        # Reuse the graph persisted by a previous process for the same file content, if any
+        cache_name = cls._graph_cache_name("schema", rdf_file_path)
+        cache_key = cls._graph_cache_key([(base_iri, buffer)])
+        graph = cls._load_cached_graph(cache_name, cache_key)
+
+        if graph is None:
+            # Initialize the graph
+            graph = Graph()
 
+            try:
+                # Parse the buffer into the graph, resolving relative IRIs against the file's location
+                cls._parse_turtle(graph, buffer, base_iri)
+            except (ParserError, ValueError, SyntaxError) as e:
+                raise ValueError(
+                    f"Failed to parse the RDF file '{rdf_file_path}'. Ensure it is a valid RDF file.") from e
+
+            cls._store_cached_graph(cache_name, cache_key, graph)
+
+        cls._SCHEMA_GRAPH = graph
         return graph
 
     @classmethod
@@ -279,9 +789,10 @@ class Laderr:
         """
         Reads a TOML file, parses its content into a Python dictionary, and extracts preamble keys into a `spec_metadata_dict` dict.
 
-        This function uses Python's built-in `tomllib` library to parse TOML files. The file must be passed as a binary
-        stream, as required by `tomllib`. It processes the top-level keys that are not part of any section (preamble) and
-        stores them in a separate `spec_metadata_dict` dictionary. Handles cases where `createdBy` is a string or a list of strings.
+        This function uses the native `rtoml` parser when it is installed and Python's built-in `tomllib` library
+        otherwise. The file is read in binary mode in a single call and its UTF-8 decoded content is parsed from memory.
+        It processes the top-level keys that are not part of any section (preamble) and stores them in a separate
+        `spec_metadata_dict` dictionary. Handles cases where `createdBy` is a string or a list of strings.
 
         :param laderr_file_path: The path to the TOML file to be read.
         :type laderr_file_path: str
@@ -290,26 +801,30 @@ class Laderr:
             - `data`: A dictionary with the remaining TOML data (sections and their contents).
         :rtype: tuple[dict[str, object], dict[str, object]]
         :raises FileNotFoundError: If the specified file does not exist or cannot be found.
-        :raises tomllib.TOMLDecodeError: If the TOML file contains invalid syntax or cannot be parsed.
+        :raises tomllib.TOMLDecodeError: If the TOML file contains invalid syntax or cannot be parsed, regardless of
+            the parser used.
         """
         try:
+            # Read the whole file at once and parse the buffer, avoiding many small reads through the IO layer
             with open(laderr_file_path, "rb") as file:
-                data: dict[str, object] = tomllib.load(file)
-
-            # Separate spec_metadata_dict and data
-            spec_metadata = {key: value for key, value in data.items() if not isinstance(value, dict)}
-            spec_data = {key: value for key, value in data.items() if isinstance(value, dict)}
-
-            # Add `id` to each item in spec_data if missing
-            for class_type, instances in spec_data.items():
-                if isinstance(instances, dict):
-                    for key, properties in instances.items():
+                buffer = file.read()
+            data: dict[str, object] = _toml_loads(buffer.decode("utf-8"))
+
+            # Separate spec_metadata_dict and data in a single pass over the parsed document
+            spec_metadata: dict[str, object] = {}
+            spec_data: dict[str, object] = {}
+            for key, value in data.items():
+                if isinstance(value, dict):
+                    spec_data[key] = value
+                    # Add `id` to each item in spec_data if missing
+                    for instance_key, properties in value.items():
                         if isinstance(properties, dict) and "id" not in properties:
-                            properties["id"] = key  # Default `id` to the section key
-
-            # Normalize `createdBy` to always be a list if it's a string
-            if "createdBy" in spec_metadata and isinstance(spec_metadata["createdBy"], str):
-                spec_metadata["createdBy"] = [spec_metadata["createdBy"]]
+                            properties["id"] = instance_key  # Default `id` to the section key
+                elif key == "createdBy" and isinstance(value, str):
+                    # Normalize `createdBy` to always be a list if it's a string
+                    spec_metadata[key] = [value]
+                else:
+                    spec_metadata[key] = value
 
             logger.success("LaDeRR specification's syntax successfully validated.")
             return spec_metadata, spec_data
@@ -317,9 +832,12 @@ class Laderr:
         except FileNotFoundError as e:
             logger.error(f"Error: File '{laderr_file_path}' not found.")
             raise e
-        except tomllib.TOMLDecodeError as e:
+        except TOML_DECODE_ERRORS as e:
             logger.error(f"Error: Syntactical error. Failed to parse LaDeRR/TOML file. {e}")
-            raise e
+            # Errors raised by `rtoml` are reported as `tomllib` errors, so callers are not affected by the parser used
+            if isinstance(e, tomllib.TOMLDecodeError):
+                raise e
+            raise tomllib.TOMLDecodeError(str(e)) from e
 
     @staticmethod
     def _save_graph(graph: Graph, file_path: str, format: str = "turtle") -> None:
@@ -330,18 +848,23 @@ class Laderr:
         :type graph: Graph
         :param file_path: The path where the graph will be saved.
         :type file_path: str
-        :param format: The serialization format (e.g., "turtle", "xml", "nt", "json-ld").
-                       Default is "turtle".
+        :param format: The serialization format (e.g., "turtle", "xml", "nt", "json-ld", "jelly").
+                       Default is "turtle". The "jelly" binary format requires the optional `pyjelly` package.
         :type format: str
         :raises ValueError: If the format is not supported.
         :raises OSError: If the file cannot be written.
         """
+        if format == "jelly" and not JELLY_AVAILABLE:
+            raise ValueError("Serialization format 'jelly' requires the optional 'pyjelly' package.")
+
         try:
-            # Ensure the output directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            # Ensure the output directory exists (a bare file name is written to the current directory)
+            output_dir = os.path.dirname(file_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
 
             # Serialize and save the graph
-            graph.serialize(destination=file_path, format=format)
+            graph.serialize(destination=file_path, format=format, encoding="utf-8")
             print(f"Graph saved successfully to '{file_path}' in format '{format}'.")
         except ValueError as e:
             raise ValueError(f"Serialization format '{format}' is not supported.") from e
@@ -364,27 +887,31 @@ class Laderr:
         else:
             logger.error("The LaDeRR specification is not correct.")
 
-        # Print the full textual validation report
-        logger.info(f"\nFull Validation Report: {report_text}")
+        # Print the full textual validation report, formatted only if the INFO level is enabled. The report is also
+        # printed for conforming specifications, as it may still contain warnings and infos.
+        logger.opt(lazy=True).info("\nFull Validation Report: {}", lambda: report_text)
 
     @classmethod
-    def _write_specification(cls, metadata_graph: Graph, data_graph: Graph, output_file: str) -> None:
+    def _write_specification(cls, graph: Graph, output_file: str) -> None:
         """
-        Serializes the metadata and data graphs into TOML format and writes to a specified file.
+        Serializes the specification graph into TOML format and writes to a specified file.
 
-        :param metadata_graph: RDF graph containing metadata.
-        :type metadata_graph: Graph
-        :param data_graph: RDF graph containing data instances.
-        :type data_graph: Graph
+        Literals attached to the LaderrSpecification instance are written as metadata, while all other subjects are
+        written as data instances.
+
+        :param graph: RDF graph containing the specification's metadata and data instances.
+        :type graph: Graph
         :param output_file: Path to the output TOML file.
         :type output_file: str
         """
         import toml
         from collections import defaultdict
 
-        # Extract metadata from the metadata_graph
+        specification = graph.value(predicate=RDF.type, object=cls.LADER_NS.LaderrSpecification)
+
+        # Extract metadata from the specification instance
         metadata = {}
-        for subject, predicate, obj in metadata_graph:
+        for predicate, obj in graph.predicate_objects(specification):
             # Use simple predicate names, removing namespace
             predicate_name = predicate.split("#")[-1]
             if isinstance(obj, Literal):
@@ -399,11 +926,11 @@ class Laderr:
         # Sort metadata by keys
         sorted_metadata = dict(sorted(metadata.items()))
 
-        # Extract data instances from the data_graph
+        # Extract data instances from the remaining subjects
         instances = defaultdict(lambda: defaultdict(dict))
-        for subject, predicate, obj in data_graph:
-            if subject != metadata_graph.value(predicate=RDF.type, object=cls.LADER_NS.LaderrSpecification):
-                instance_type = str(data_graph.value(subject=subject, predicate=RDF.type)).split("#")[-1]
+        for subject, predicate, obj in graph:
+            if subject != specification:
+                instance_type = str(graph.value(subject=subject, predicate=RDF.type)).split("#")[-1]
                 instance_id = str(subject).split("#")[-1]
                 predicate_name = predicate.split("#")[-1]
 
@@ -0,0 +1,392 @@
+import os
+import tomllib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from rdflib import BNode, Graph, Literal, URIRef, XSD
+from rdflib.compare import isomorphic
+
+from laderr_lib import laderr
+from laderr_lib.laderr import Laderr
+
+SCHEMA_CONTENT = "@prefix ex: <http://example.org/> . ex:Asset a ex:Class ; ex:label \"Asset\" ."
+
+
+@pytest.fixture
+def cached_schema(tmp_path, monkeypatch):
+    """
+    Points `Laderr` to a schema file in a temporary directory and enables the on-disk graph cache in another one.
+
+    The in-process schema graph is reset, so the schema is loaded as in a new process.
+
+    :param tmp_path: Temporary directory provided by pytest.
+    :type tmp_path: pathlib.Path
+    :param monkeypatch: Pytest fixture used to change the `Laderr` class attributes.
+    :type monkeypatch: pytest.MonkeyPatch
+    :return: The schema file and the cache directory.
+    :rtype: tuple[pathlib.Path, pathlib.Path]
+    """
+    schema_file = tmp_path / "schema.ttl"
+    schema_file.write_text(SCHEMA_CONTENT, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(Laderr, "SCHEMA_PATH", str(schema_file))
+    monkeypatch.setattr(Laderr, "CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(Laderr, "_SCHEMA_GRAPH", None)
+    return schema_file, cache_dir
+
+
+def test_merge_shacl_files_keeps_blank_nodes_of_different_files_apart(tmp_path, monkeypatch) -> None:
+    """
+    Tests that blank nodes with the same label in different SHACL files are not merged into a single node.
+
+    :param tmp_path: Temporary directory provided by pytest.
+    :type tmp_path: pathlib.Path
+    :param monkeypatch: Pytest fixture used to disable the on-disk graph cache.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(Laderr, "CACHE_DIR", None)
+    expected_graph = Graph()
+    for name in ("a.ttl", "b.ttl"):
+        content = f"@prefix ex: <http://example.org/> . ex:s{name[0]} ex:p _:b0 . _:b0 ex:q ex:o ."
+        (tmp_path / name).write_text(content, encoding="utf-8")
+        expected_graph.parse(data=content, format="turtle")
+
+    merged_graph = Laderr._merge_shacl_files(str(tmp_path))
+
+    blank_nodes = {term for triple in merged_graph for term in triple if isinstance(term, BNode)}
+    expected_blank_nodes = {term for triple in expected_graph for term in triple if isinstance(term, BNode)}
+    assert len(merged_graph) == len(expected_graph) == 4
+    assert len(blank_nodes) == len(expected_blank_nodes) == 2
+
+
+def test_load_spec_data_keeps_lexical_form_of_equal_datetimes() -> None:
+    """
+    Tests that equal date-times with different time zone offsets keep their own literals in the data graph.
+
+    Python considers both values equal, but their lexical forms, which are validated, differ.
+    """
+    utc_value = datetime(2020, 1, 1, 12, 0, tzinfo=timezone.utc)
+    offset_value = datetime(2020, 1, 1, 13, 0, tzinfo=timezone(timedelta(hours=1)))
+    spec_data = {"Asset": {"A": {"id": "A", "createdOn": utc_value}, "B": {"id": "B", "createdOn": offset_value}}}
+
+    graph = Laderr._load_spec_data({}, spec_data)
+
+    values = {str(literal) for literal in graph.objects(None, Laderr.LADER_NS.createdOn)}
+    assert values == {"2020-01-01T12:00:00+00:00", "2020-01-01T13:00:00+01:00"}
+
+
+def test_parse_turtle_matches_rdflib_parser() -> None:
+    """
+    Tests that Turtle content parsed by `Laderr` yields the same triples as RDFLib's own Turtle parser.
+
+    Plain, language-tagged, and typed literals are covered, as `pyoxigraph` (when installed) represents them
+    differently.
+    """
+    content = '@prefix ex: <http://example.org/> . ex:s ex:p "plain", "tagged"@en, 1, "typed"^^ex:T, <o> .'
+    graph = Graph()
+
+    Laderr._parse_turtle(graph, content.encode("utf-8"), "http://example.org/base/")
+
+    expected_graph = Graph().parse(data=content, format="turtle", publicID="http://example.org/base/")
+    assert set(graph) == set(expected_graph)
+
+
+def test_load_schema_reuses_graph_persisted_by_previous_process(cached_schema, monkeypatch) -> None:
+    """
+    Tests that a schema graph persisted in the on-disk cache is loaded without parsing the schema file again.
+
+    :param cached_schema: The schema file and the cache directory.
+    :type cached_schema: tuple[pathlib.Path, pathlib.Path]
+    :param monkeypatch: Pytest fixture used to reset the in-process cache and to forbid parsing.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    _, cache_dir = cached_schema
+    parsed_graph = Laderr._load_schema()
+    assert len(list(cache_dir.glob("schema-*.pkl"))) == 1
+
+    monkeypatch.setattr(Laderr, "_SCHEMA_GRAPH", None)
+    monkeypatch.setattr(Laderr, "_parse_turtle", lambda *args: pytest.fail("The cached schema was parsed again."))
+    cached_graph = Laderr._load_schema()
+
+    assert cached_graph is not parsed_graph
+    assert isomorphic(cached_graph, parsed_graph)
+
+
+def test_graph_cache_key_changes_with_content(cached_schema, monkeypatch) -> None:
+    """
+    Tests that changing the schema file's content changes its cache key and replaces the stale persisted graph.
+
+    :param cached_schema: The schema file and the cache directory.
+    :type cached_schema: tuple[pathlib.Path, pathlib.Path]
+    :param monkeypatch: Pytest fixture used to reset the in-process cache.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    schema_file, cache_dir = cached_schema
+    name = Laderr._graph_cache_name("schema", str(schema_file))
+    base_iri = schema_file.absolute().as_uri()
+    key = Laderr._graph_cache_key([(base_iri, SCHEMA_CONTENT.encode("utf-8"))])
+    assert key == Laderr._graph_cache_key([(base_iri, SCHEMA_CONTENT.encode("utf-8"))])
+
+    Laderr._load_schema()
+    assert [file.name for file in cache_dir.glob("schema-*.pkl")] == [f"{name}-{key}.pkl"]
+
+    changed_content = SCHEMA_CONTENT.replace("Asset", "Capability")
+    schema_file.write_text(changed_content, encoding="utf-8")
+    changed_key = Laderr._graph_cache_key([(base_iri, changed_content.encode("utf-8"))])
+    assert changed_key != key
+
+    monkeypatch.setattr(Laderr, "_SCHEMA_GRAPH", None)
+    graph = Laderr._load_schema()
+
+    assert "Capability" in graph.serialize(format="nt")
+    assert [file.name for file in cache_dir.glob("schema-*")] == [f"{name}-{changed_key}.pkl"]
+
+
+def test_graph_cache_keeps_graphs_of_different_shapes_directories(tmp_path, monkeypatch) -> None:
+    """
+    Tests that the graphs parsed from two shapes directories sharing the on-disk cache do not replace each other.
+
+    :param tmp_path: Temporary directory provided by pytest.
+    :type tmp_path: pathlib.Path
+    :param monkeypatch: Pytest fixture used to enable the on-disk graph cache and to reset the in-process cache.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(Laderr, "CACHE_DIR", str(cache_dir))
+    shapes_dirs = [tmp_path / "shapes_a", tmp_path / "shapes_b"]
+    for shapes_dir in shapes_dirs:
+        shapes_dir.mkdir()
+        (shapes_dir / "shapes.ttl").write_text(
+            f"@prefix ex: <http://example.org/> . ex:{shapes_dir.name} ex:p ex:o .", encoding="utf-8")
+        Laderr._merge_shacl_files(str(shapes_dir))
+
+    assert len(list(cache_dir.glob("shapes-*.pkl"))) == 2
+
+    # Both persisted graphs are loaded by a new process, without parsing the shapes files again
+    monkeypatch.setattr(Laderr, "_SHACL_GRAPH_CACHE", {})
+    monkeypatch.setattr(Laderr, "_parse_turtle", lambda *args: pytest.fail("The cached shapes were parsed again."))
+    for shapes_dir in shapes_dirs:
+        graph = Laderr._merge_shacl_files(str(shapes_dir))
+        assert set(graph.subjects()) == {URIRef(f"http://example.org/{shapes_dir.name}")}
+
+
+def test_load_schema_ignores_unreadable_cache_file(cached_schema) -> None:
+    """
+    Tests that an unreadable file in the on-disk cache is ignored and the schema file is parsed instead.
+
+    :param cached_schema: The schema file and the cache directory.
+    :type cached_schema: tuple[pathlib.Path, pathlib.Path]
+    """
+    schema_file, cache_dir = cached_schema
+    name = Laderr._graph_cache_name("schema", str(schema_file))
+    key = Laderr._graph_cache_key([(schema_file.absolute().as_uri(), SCHEMA_CONTENT.encode("utf-8"))])
+    cache_dir.mkdir(mode=0o700)
+    (cache_dir / f"{name}-{key}.pkl").write_bytes(b"not a pickle")
+
+    graph = Laderr._load_schema()
+
+    expected_graph = Graph().parse(data=SCHEMA_CONTENT, format="turtle")
+    assert isomorphic(graph, expected_graph)
+
+
+def test_data_path_prefers_configured_location_over_packaged_resource(monkeypatch) -> None:
+    """
+    Tests that a configured location is used as is and that resources shipped in the package resolve to a file.
+
+    :param monkeypatch: Pytest fixture used to reset the resolved package locations.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(Laderr, "_PACKAGED_PATHS", {})
+
+    assert Laderr._data_path("/custom/schema.ttl", "py.typed", "LADERR_SCHEMA_PATH") == "/custom/schema.ttl"
+    assert os.path.isfile(Laderr._data_path(None, "py.typed", "LADERR_SCHEMA_PATH"))
+
+
+def test_load_schema_names_variable_when_no_schema_is_available(monkeypatch) -> None:
+    """
+    Tests that loading the schema without a configured or packaged schema file names the variable to be set.
+
+    :param monkeypatch: Pytest fixture used to unset the schema location and to hide the packaged schema.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(Laderr, "SCHEMA_PATH", None)
+    monkeypatch.setattr(Laderr, "_PACKAGED_SCHEMA", "missing-schema.ttl")
+    monkeypatch.setattr(Laderr, "_SCHEMA_GRAPH", None)
+
+    with pytest.raises(FileNotFoundError, match="LADERR_SCHEMA_PATH"):
+        Laderr._load_schema()
+
+
+@pytest.mark.parametrize(
+    ("spec_metadata", "expected_base_uri"),
+    [
+        ({"baseUri": "https://example.org/spec#"}, "https://example.org/spec#"),
+        ({"baseUri": "not-a-valid-uri"}, "https://laderr.laderr#"),
+        ({"baseUri": ["https://example1.com", "https://example2.com"]}, "https://laderr.laderr#"),
+        ({}, "https://laderr.laderr#"),
+    ],
+    ids=["valid", "invalid-string", "list", "missing"],
+)
+def test_validate_base_uri(spec_metadata: dict[str, object], expected_base_uri: str) -> None:
+    """
+    Tests that a valid base URI is kept and that invalid, non-string, or missing base URIs are replaced by the default.
+
+    :param spec_metadata: Metadata dictionary of the specification.
+    :type spec_metadata: dict[str, object]
+    :param expected_base_uri: The base URI expected to be used for the specification.
+    :type expected_base_uri: str
+    """
+    assert Laderr._validate_base_uri(spec_metadata) == expected_base_uri
+
+
+def test_load_spec_metadata_adds_base_uri_only_when_not_declared() -> None:
+    """
+    Tests that the base URI used for the data is added to the metadata when no `baseUri` is declared, and that a
+    declared `baseUri` is kept as declared, even when invalid.
+    """
+    base_uri_property = Laderr.LADER_NS.baseUri
+
+    graph = Laderr._load_spec_metadata({"title": "Specification"})
+    specification = URIRef("https://laderr.laderr#LaderrSpecification")
+    assert list(graph.objects(specification, base_uri_property)) == [
+        Literal("https://laderr.laderr#", datatype=XSD.anyURI)]
+
+    graph = Laderr._load_spec_metadata({"baseUri": "not-a-valid-uri"})
+    assert list(graph.objects(specification, base_uri_property)) == [Literal("not-a-valid-uri", datatype=XSD.anyURI)]
+
+
+def test_merge_shacl_files_reuses_graph_until_shapes_files_change(tmp_path, monkeypatch) -> None:
+    """
+    Tests that the merged shapes graph is reused while the directory's SHACL files are unchanged, that touching or
+    adding a SHACL file rebuilds it, and that files with other extensions are ignored.
+
+    :param tmp_path: Temporary directory provided by pytest.
+    :type tmp_path: pathlib.Path
+    :param monkeypatch: Pytest fixture used to disable the on-disk graph cache.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(Laderr, "CACHE_DIR", None)
+    shapes_file = tmp_path / "a.ttl"
+    shapes_file.write_text("@prefix ex: <http://example.org/> . ex:a ex:p ex:o .", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# Not a SHACL file", encoding="utf-8")
+
+    graph = Laderr._merge_shacl_files(str(tmp_path))
+    assert len(graph) == 1
+    assert Laderr._merge_shacl_files(str(tmp_path)) is graph
+
+    # Files with other extensions are ignored, so changing them does not rebuild the graph
+    (tmp_path / "README.md").write_text("# Still not a SHACL file", encoding="utf-8")
+    assert Laderr._merge_shacl_files(str(tmp_path)) is graph
+
+    # Touching a SHACL file rebuilds the graph
+    status = shapes_file.stat()
+    os.utime(shapes_file, ns=(status.st_atime_ns, status.st_mtime_ns + 1_000_000_000))
+    touched_graph = Laderr._merge_shacl_files(str(tmp_path))
+    assert touched_graph is not graph
+    assert len(touched_graph) == 1
+
+    # Adding a SHACL file rebuilds the graph with its triples
+    (tmp_path / "b.shacl").write_text("@prefix ex: <http://example.org/> . ex:b ex:p ex:o .", encoding="utf-8")
+    added_graph = Laderr._merge_shacl_files(str(tmp_path))
+    assert added_graph is not touched_graph
+    assert len(added_graph) == 2
+
+
+def test_read_specification_raises_tomllib_error_for_any_parser(tmp_path, monkeypatch) -> None:
+    """
+    Tests that a syntax error reported by a TOML parser other than `tomllib` (e.g., `rtoml`) is raised as a
+    `tomllib.TOMLDecodeError` chained to the parser's own error.
+
+    :param tmp_path: Temporary directory provided by pytest.
+    :type tmp_path: pathlib.Path
+    :param monkeypatch: Pytest fixture used to replace the TOML parser.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+
+    class ParserError(Exception):
+        pass
+
+    def failing_loads(content: str) -> dict[str, object]:
+        raise ParserError("invalid TOML")
+
+    monkeypatch.setattr(laderr, "_toml_loads", failing_loads)
+    monkeypatch.setattr(laderr, "TOML_DECODE_ERRORS", (tomllib.TOMLDecodeError, ParserError))
+    spec_file = tmp_path / "spec.toml"
+    spec_file.write_text("title = ", encoding="utf-8")
+
+    with pytest.raises(tomllib.TOMLDecodeError, match="invalid TOML") as error:
+        Laderr._read_specification(str(spec_file))
+    assert isinstance(error.value.__cause__, ParserError)
+
+
+@pytest.mark.skipif(not laderr.JELLY_AVAILABLE, reason="The optional 'pyjelly' package is not installed.")
+def test_save_graph_round_trips_jelly(tmp_path) -> None:
+    """
+    Tests that a graph saved in the Jelly format is parsed back into an isomorphic graph.
+
+    Jelly follows RDF 1.1, in which `xsd:string` literals and plain literals are the same, and writes the former as the
+    latter. Both graphs are therefore compared with `xsd:string` literals turned into plain literals.
+
+    :param tmp_path: Temporary directory provided by pytest.
+    :type tmp_path: pathlib.Path
+    """
+
+    def plain_strings(graph: Graph) -> Graph:
+        normalized = Graph()
+        for triple in graph:
+            normalized.add(tuple(Literal(str(term)) if isinstance(term, Literal) and term.datatype == XSD.string
+                                 else term for term in triple))
+        return normalized
+
+    graph = Laderr._load_spec_metadata({"title": "Specification", "baseUri": "https://example.org/spec#"})
+    output_file = tmp_path / "graph.jelly"
+
+    Laderr._save_graph(graph, str(output_file), format="jelly")
+
+    parsed_graph = Graph().parse(str(output_file), format="jelly")
+    assert len(parsed_graph) == len(graph)
+    assert isomorphic(plain_strings(parsed_graph), plain_strings(graph))
+
+def test_save_graph_rejects_jelly_without_pyjelly(tmp_path, monkeypatch) -> None:
+    """
+    Tests that saving a graph in the Jelly format without the optional `pyjelly` package raises a ValueError.
+
+    :param tmp_path: Temporary directory provided by pytest.
+    :type tmp_path: pathlib.Path
+    :param monkeypatch: Pytest fixture used to hide the `pyjelly` package.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(laderr, "JELLY_AVAILABLE", False)
+    output_file = tmp_path / "graph.jelly"
+
+    with pytest.raises(ValueError, match="pyjelly"):
+        Laderr._save_graph(Graph(), str(output_file), format="jelly")
+    assert not output_file.exists()
+
+
+def test_save_graph_writes_bare_file_name_to_current_directory(tmp_path, monkeypatch) -> None:
+    """
+    Tests that a graph saved under a file name without directory is written to the current working directory.
+
+    :param tmp_path: Temporary directory provided by pytest, used as the current working directory.
+    :type tmp_path: pathlib.Path
+    :param monkeypatch: Pytest fixture used to change the current working directory.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.chdir(tmp_path)
+
+    Laderr._save_graph(Laderr._load_spec_metadata({"title": "Specification"}), "out.nt", format="nt")
+
+    assert (tmp_path / "out.nt").is_file()
+
+
+def test_load_spec_data_does_not_retain_specification_terms() -> None:
+    """
+    Tests that the class and property names read from a specification are not retained across calls.
+    """
+    terms = dict(Laderr._LADERR_TERMS)
+
+    graph = Laderr._load_spec_data({}, {"CustomClass": {"A": {"customProperty": "value"}}})
+
+    assert (None, Laderr.LADER_NS.customProperty, Literal("value")) in graph
+    assert Laderr._LADERR_TERMS == terms
@@ -20,6 +20,17 @@ def generate_test_cases_from_folder(folder_path: str):
             yield os.path.join(folder_path, file_name)
 
 
+@pytest.fixture(scope="session")
+def laderr_graphs() -> None:
+    """
+    Parses the LaDeRR SHACL shapes and schema once per test session.
+
+    The parsed graphs are cached by `Laderr`, so every validation test reuses them instead of paying the parsing cost.
+    """
+    Laderr._load_shacl_shapes()
+    Laderr._load_schema()
+
+
 @pytest.mark.parametrize("file_path", generate_test_cases_from_folder("test_files/invalid/syntax"))
 def test_validate_syntax_errors(file_path: str) -> None:
     """
@@ -39,6 +50,7 @@ def test_validate_syntax_errors(file_path: str) -> None:
     pytest.fail(f"No TOMLDecodeError was raised for file: {file_path}")
 
 
+@pytest.mark.usefixtures("laderr_graphs")
 @pytest.mark.parametrize("file_path", generate_test_cases_from_folder("test_files/invalid/metadata/datatype"))
 def test_validate_metadata_invalid_datatype(file_path: str) -> None:
     """
@@ -52,9 +64,10 @@ def test_validate_metadata_invalid_datatype(file_path: str) -> None:
     :type file_path: str
     :raises AssertionError: If the validation returns `True` for a file that is expected to fail.
     """
-    assert not Laderr.validate(file_path), f"Validation incorrectly passed for file: {file_path}"
+    assert not Laderr.validate(file_path, verbose=False), f"Validation incorrectly passed for file: {file_path}"
 
 
+@pytest.mark.usefixtures("laderr_graphs")
 @pytest.mark.parametrize("file_path", generate_test_cases_from_folder("test_files/invalid/metadata/multiplicity"))
 def test_validate_metadata_invalid_multiplicity(file_path: str) -> None:
     """
@@ -64,9 +77,10 @@ def test_validate_metadata_invalid_multiplicity(file_path: str) -> None:
     :type file_path: str
     :raises AssertionError: If the validation does not raise the expected value.
     """
-    assert not Laderr.validate(file_path), f"Validation incorrectly passed for file: {file_path}"
+    assert not Laderr.validate(file_path, verbose=False), f"Validation incorrectly passed for file: {file_path}"
 
 
+@pytest.mark.usefixtures("laderr_graphs")
 @pytest.mark.parametrize("file_path", generate_test_cases_from_folder("test_files/invalid/metadata/undefined"))
 def test_validate_metadata_invalid_undefined(file_path: str) -> None:
     """
@@ -76,9 +90,10 @@ def test_validate_metadata_invalid_undefined(file_path: str) -> None:
     :type file_path: str
     :raises AssertionError: If the validation does not raise the expected value.
     """
-    assert not Laderr.validate(file_path), f"Validation incorrectly passed for file: {file_path}"
+    assert not Laderr.validate(file_path, verbose=False), f"Validation incorrectly passed for file: {file_path}"
 
 
+@pytest.mark.usefixtures("laderr_graphs")
 @pytest.mark.parametrize("file_path", generate_test_cases_from_folder("test_files/invalid/metadata/combined"))
 def test_validate_metadata_invalid_combined(file_path: str) -> None:
     """
@@ -88,8 +103,9 @@ def test_validate_metadata_invalid_combined(file_path: str) -> None:
     :type file_path: str
     :raises AssertionError: If the validation does not raise the expected value.
     """
-    assert not Laderr.validate(file_path), f"Validation incorrectly passed for file: {file_path}"
+    assert not Laderr.validate(file_path, verbose=False), f"Validation incorrectly passed for file: {file_path}"
 
+@pytest.mark.usefixtures("laderr_graphs")
 @pytest.mark.parametrize("file_path", generate_test_cases_from_folder("test_files/valid"))
 def test_validate_metadata_valid(file_path: str) -> None:
     """
@@ -99,4 +115,4 @@ def test_validate_metadata_valid(file_path: str) -> None:
     :type file_path: str
     :raises AssertionError: If the validation does not raise the expected value.
     """
-    assert Laderr.validate(file_path), f"Validation incorrectly not passed for file: {file_path}"
\ No newline at end of file
+    assert Laderr.validate(file_path, verbose=False), f"Validation incorrectly not passed for file: {file_path}"
\ No newline at end of file